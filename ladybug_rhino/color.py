@@ -1,16 +1,21 @@
 """Collection of methods for converting between Ladybug and .NET colors."""
 
 try:
+    from System import Array
     from System.Drawing import Color
 except ImportError as e:
     raise ImportError("Failed to import Windows/.NET libraries\n{}".format(e))
 
+# .NET colors are immutable so the commonly-used ones are only fetched once
+_GRAY = Color.Gray
+_BLACK = Color.Black
+
 
 def color_to_color(color, alpha=255):
     """Convert a ladybug color into .NET color.
 
     Args:
-        alpha: Optional integer betwen 1 and 255 for the alpha value of the color.
+        alpha: Optional integer between 1 and 255 for the alpha value of the color.
     """
     try:
         return Color.FromArgb(alpha, color.r, color.g, color.b)
@@ -18,11 +23,35 @@ def color_to_color(color, alpha=255):
         raise AttributeError('Input must be of type of Color:\n{}'.format(e))
 
 
+def colors_to_colors(colors, alpha=255):
+    """Convert an array of ladybug colors into a .NET array of .NET colors.
+
+    This is faster than using color_to_color on each color when there are many
+    colors to convert, such as when coloring a mesh with analysis results.
+
+    Args:
+        colors: An array of ladybug colors.
+        alpha: Optional integer between 1 and 255 for the alpha value of the colors.
+
+    Returns:
+        A .NET array of colors (Color[]), which can be used directly with Rhino
+        methods like Mesh.VertexColors.SetColors.
+    """
+    from_argb = Color.FromArgb  # look up the .NET method only once
+    net_colors = Array.CreateInstance(Color, len(colors))
+    try:
+        for i, col in enumerate(colors):
+            net_colors[i] = from_argb(alpha, col.r, col.g, col.b)
+    except AttributeError as e:
+        raise AttributeError('Input must be of type of Color:\n{}'.format(e))
+    return net_colors
+
+
 def gray():
     """Get a .NET gray color object. Useful when you need a placeholder color."""
-    return Color.Gray
+    return _GRAY
 
 
 def black():
     """Get a .NET black color object. Useful for things like default text."""
-    return Color.Black
+    return _BLACK
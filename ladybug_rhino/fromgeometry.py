@@ -1,6 +1,12 @@
 """Functions to translate from Ladybug geomtries to Rhino geometries."""
 from .config import tolerance
-from .color import color_to_color, gray
+from .color import color_to_color, colors_to_colors
+
+try:
+    from System import Array
+    from System.Drawing import Color
+except ImportError as e:
+    raise ImportError('Failed to import Windows/.NET libraries\n{}'.format(e))
 
 try:
     import Rhino.Geometry as rg
@@ -44,13 +50,13 @@ def from_arc2d(arc, z=0):
 
 def from_polygon2d(polygon, z=0):
     """Rhino closed PolyLineCurve from ladybug Polygon2D."""
-    return rg.PolylineCurve(
-        [from_point2d(pt, z) for pt in polygon.vertices] + [from_point2d(polygon[0], z)])
+    rhino_pts = _point3d_array(polygon.vertices, _get_point2d_function(z), True)
+    return rg.PolylineCurve(rhino_pts)
 
 
 def from_polyline2d(polyline, z=0):
     """Rhino closed PolyLineCurve from ladybug Polyline2D."""
-    rhino_pts = [from_point2d(pt, z) for pt in polyline.vertices]
+    rhino_pts = _point3d_array(polyline.vertices, _get_point2d_function(z))
     if polyline.interpolated:
         return rg.Curve.CreateInterpolatedCurve(
             rhino_pts, 3, rg.CurveKnotStyle.UniformPeriodic)
@@ -109,7 +115,7 @@ def from_arc3d(arc):
 
 def from_polyline3d(polyline):
     """Rhino closed PolyLineCurve from ladybug Polyline3D."""
-    rhino_pts = [from_point3d(pt) for pt in polyline.vertices]
+    rhino_pts = _point3d_array(polyline.vertices, from_point3d)
     if polyline.interpolated:
         return rg.Curve.CreateInterpolatedCurve(
             rhino_pts, 3, rg.CurveKnotStyle.UniformPeriodic)
@@ -124,15 +130,15 @@ def from_mesh3d(mesh):
 
 def from_face3d(face):
     """Rhino Brep from ladybug Face3D."""
-    segs = [from_linesegment3d(seg) for seg in face.boundary_segments]
+    segs = _loop_line_curves(face.boundary)
     try:
         brep = rg.Brep.CreatePlanarBreps(segs, tolerance)[0]
     except TypeError:  # not planar in Rhino model tolerance; maybe from another model
         print('Brep not planar in Rhino model tolerance. Ignoring tolerance.')
         brep = rg.Brep.CreatePlanarBreps(segs, 1e6)[0]
     if face.has_holes:
-        for hole in face.hole_segments:
-            trim_crvs = [from_linesegment3d(seg) for seg in hole]
+        for hole in face.holes:
+            trim_crvs = _loop_line_curves(hole)
             brep.Loops.AddPlanarFaceLoop(0, rg.BrepLoopType.Inner, trim_crvs)
     return brep
 
@@ -256,9 +262,10 @@ def _translate_mesh(mesh, pt_function):
     rhino_mesh = rg.Mesh()
     if mesh.is_color_by_face:  # Mesh is constructed face-by-face
         _f_num = 0
+        rh_pts = [pt_function(pt) for pt in mesh.vertices]  # convert each vertex once
         for face in mesh.faces:
-            for pt in tuple(mesh[i] for i in face):
-                rhino_mesh.Vertices.Add(pt_function(pt))
+            for i in face:
+                rhino_mesh.Vertices.Add(rh_pts[i])
             if len(face) == 4:
                 rhino_mesh.Faces.AddFace(
                     _f_num, _f_num + 1, _f_num + 2, _f_num + 3)
@@ -266,31 +273,56 @@ def _translate_mesh(mesh, pt_function):
             else:
                 rhino_mesh.Faces.AddFace(_f_num, _f_num + 1, _f_num + 2)
                 _f_num += 3
-        if mesh.colors is not None:
-            rhino_mesh.VertexColors.CreateMonotoneMesh(gray())
-            _f_num = 0
+        if mesh.colors is not None:  # give each face vertex the color of its face
+            face_cols = colors_to_colors(mesh.colors)
+            vert_cols = Array.CreateInstance(Color, _f_num)  # _f_num is vertex count
+            _v_num = 0
             for i, face in enumerate(mesh.faces):
-                col = color_to_color(mesh.colors[i])
-                rhino_mesh.VertexColors[_f_num] = col
-                rhino_mesh.VertexColors[_f_num + 1] = col
-                rhino_mesh.VertexColors[_f_num + 2] = col
-                if len(face) == 4:
-                    rhino_mesh.VertexColors[_f_num + 3] = col
-                    _f_num += 4
-                else:
-                    _f_num += 3
+                col = face_cols[i]
+                for _ in face:
+                    vert_cols[_v_num] = col
+                    _v_num += 1
+            rhino_mesh.VertexColors.SetColors(vert_cols)
     else:  # Mesh is constructed vertex-by-vertex
         for pt in mesh.vertices:
             rhino_mesh.Vertices.Add(pt_function(pt))
         for face in mesh.faces:
             rhino_mesh.Faces.AddFace(*face)
         if mesh.colors is not None:
-            rhino_mesh.VertexColors.CreateMonotoneMesh(gray())
-            for i, col in enumerate(mesh.colors):
-                rhino_mesh.VertexColors[i] = color_to_color(col)
+            rhino_mesh.VertexColors.SetColors(colors_to_colors(mesh.colors))
     return rhino_mesh
 
 
+def _loop_line_curves(vertices):
+    """Convert a closed loop of Ladybug Geometry points into a list of Rhino LineCurves.
+
+    Each point is only converted once even though it is shared by two segments.
+    """
+    pts = [from_point3d(pt) for pt in vertices]
+    return [rg.LineCurve(pts[i - 1], pts[i]) for i in range(1, len(pts))] + \
+        [rg.LineCurve(pts[-1], pts[0])]
+
+
 def _polyline_points(tup):
     """Convert a tuple of Ladybug Geometry points to a Rhino Polyline."""
-    return rg.PolylineCurve([from_point3d(pt) for pt in tup] + [from_point3d(tup[0])])
+    return rg.PolylineCurve(_point3d_array(tup, from_point3d, True))
+
+
+def _point3d_array(points, pt_function, close=False):
+    """Convert Ladybug Geometry points into a typed Rhino Point3d[] array.
+
+    Rhino can use the array directly without enumerating a Python list.
+
+    Args:
+        points: A list or tuple of Ladybug Geometry points.
+        pt_function: A function to convert each Ladybug point to a Rhino Point3d.
+        close: Boolean to note whether the first point should be repeated at
+            the end of the array in order to close a polyline. (Default: False).
+    """
+    pt_count = len(points)
+    rhino_pts = Array.CreateInstance(rg.Point3d, pt_count + 1 if close else pt_count)
+    for i, pt in enumerate(points):
+        rhino_pts[i] = pt_function(pt)
+    if close:  # close the polyline without converting again
+        rhino_pts[pt_count] = rhino_pts[0]
+    return rhino_pts
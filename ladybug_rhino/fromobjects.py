@@ -30,19 +30,20 @@ def legend_objects(legend):
 
         -   legend_text -- Bake-able text objects for the rest of the legend text.
     """
-    _height = legend.legend_parameters.text_height
-    _font = legend.legend_parameters.font
+    l_par = legend.legend_parameters
+    _height = l_par.text_height
+    _font = l_par.font
     legend_mesh = from_mesh3d(legend.segment_mesh)
     legend_title = text_objects(legend.title, legend.title_location, _height, _font)
-    if legend.legend_parameters.continuous_legend is False:
-        legend_text = [text_objects(txt, loc, _height, _font, 0, 5) for txt, loc in
-                       zip(legend.segment_text, legend.segment_text_location)]
-    elif legend.legend_parameters.vertical is True:
-        legend_text = [text_objects(txt, loc, _height, _font, 0, 3) for txt, loc in
-                       zip(legend.segment_text, legend.segment_text_location)]
+    # determine the text alignment once for all of the segment text
+    if l_par.continuous_legend is False:
+        h_align, v_align = 0, 5
+    elif l_par.vertical is True:
+        h_align, v_align = 0, 3
     else:
-        legend_text = [text_objects(txt, loc, _height, _font, 1, 5) for txt, loc in
-                       zip(legend.segment_text, legend.segment_text_location)]
+        h_align, v_align = 1, 5
+    legend_text = [text_objects(txt, loc, _height, _font, h_align, v_align)
+                   for txt, loc in zip(legend.segment_text, legend.segment_text_location)]
     return [legend_mesh] + [legend_title] + legend_text
 
 
@@ -4,6 +4,7 @@ These represent geometry computation methods  that are either not supported by
 ladybug_geometry or there are much more efficient versions of them in Rhino.
 """
 import math
+import heapq
 
 try:
     import System.Threading.Tasks as tasks
@@ -187,7 +188,7 @@ def intersect_mesh_lines(mesh, start_points, end_points, max_dist=None, parallel
     return int_matrix
 
 
-def intersect_solids_parallel(solids, bound_boxes):
+def intersect_solids_parallel(solids, bound_boxes, cpu_count=None):
     """Intersect the co-planar faces of an array of solids using parallel processing.
 
     Args:
@@ -196,37 +197,43 @@ def intersect_solids_parallel(solids, bound_boxes):
         bound_boxes: An array of Rhino bounding boxes that parellels the input
             solids and will be used to check whether two Breps have any potential
             for intersection before the actual intersection is performed.
+        cpu_count: An integer for the maximum number of CPUs to use for the
+            intersection. If None, all available CPUs will be used. (Default: None).
 
     Returns:
         int_solids -- The input array of solids, which have all been intersected
         with one another.
     """
     int_solids = solids[:]  # copy the input list to avoid editing it
+    extents = _bound_box_extents(bound_boxes)  # read the .NET properties only once
+
+    # check each pair of bounding boxes only once and record the overlaps for both
+    overlap_pairs = _overlapping_pairs(extents)
+    neighbors = [[] for _ in solids]
+    for i, j in overlap_pairs:  # the solids that come after each solid
+        neighbors[i].append(j)
+    for i, j in overlap_pairs:  # the solids that come before each solid
+        neighbors[j].append(i)
 
     def intersect_each_solid(i):
-        """Intersect a solid with all of the other solids of the list."""
-        bb_1 = bound_boxes[i]
-        # intersect the solids that come after this one
-        for j, bb_2 in enumerate(bound_boxes[i + 1:]):
-            if not overlapping_bounding_boxes(bb_1, bb_2):
-                continue  # no overlap in bounding box; intersection impossible
-            split_brep1, int_exists = intersect_solid(int_solids[i], int_solids[i + j + 1])
-            if int_exists:
-                int_solids[i] = split_brep1
-        # intersect the solids that come before this one
-        for j, bb_2 in enumerate(bound_boxes[:i]):
-            if not overlapping_bounding_boxes(bb_1, bb_2):
-                continue  # no overlap in bounding box; intersection impossible
-            split_brep2, int_exists = intersect_solid(int_solids[i], int_solids[j])
+        """Intersect a solid with all of the other solids that it may touch."""
+        for j in neighbors[i]:
+            split_brep, int_exists = intersect_solid(
+                int_solids[i], int_solids[j], False)
             if int_exists:
-                int_solids[i] = split_brep2
+                int_solids[i] = split_brep
 
-    tasks.Parallel.ForEach(range(len(solids)), intersect_each_solid)
+    if cpu_count is not None:
+        options = tasks.ParallelOptions()
+        options.MaxDegreeOfParallelism = cpu_count
+        tasks.Parallel.ForEach(range(len(solids)), options, intersect_each_solid)
+    else:
+        tasks.Parallel.ForEach(range(len(solids)), intersect_each_solid)
 
     return int_solids
 
 
-def intersect_solids(solids, bound_boxes):
+def intersect_solids(solids, bound_boxes, in_place=False):
     """Intersect the co-planar faces of an array of solids.
 
     Args:
@@ -235,39 +242,44 @@ def intersect_solids(solids, bound_boxes):
         bound_boxes: An array of Rhino bounding boxes that parellels the input
             solids and will be used to check whether two Breps have any potential
             for intersection before the actual intersection is performed.
+        in_place: Boolean to note whether the input list of solids should be
+            edited in place with the intersected solids instead of copying it.
+            This avoids copying the list but it means that the original list
+            will no longer contain the original solids. (Default: False).
 
     Returns:
         int_solids -- The input array of solids, which have all been intersected
         with one another.
     """
-    int_solids = solids[:]  # copy the input list to avoid editing it
-
-    for i, bb_1 in enumerate(bound_boxes):
-        for j, bb_2 in enumerate(bound_boxes[i + 1:]):
-            if not overlapping_bounding_boxes(bb_1, bb_2):
-                continue  # no overlap in bounding box; intersection impossible
-
-            # split the first solid with the second one
-            split_brep1, int_exists = intersect_solid(
-                int_solids[i], int_solids[i + j + 1])
-            int_solids[i] = split_brep1
-
-            # split the second solid with the first one if an intersection was found
-            if int_exists:
-                split_brep2, int_exists = intersect_solid(
-                    int_solids[i + j + 1], int_solids[i])
-                int_solids[i + j + 1] = split_brep2
+    # copy the input list to avoid editing it unless it is to be edited in place
+    int_solids = solids if in_place else solids[:]
+    extents = _bound_box_extents(bound_boxes)  # read the .NET properties only once
+
+    for i, j in _overlapping_pairs(extents):
+        # split the first solid with the second one
+        split_brep1, int_exists = intersect_solid(
+            int_solids[i], int_solids[j], False)
+        int_solids[i] = split_brep1
+
+        # split the second solid with the first one if an intersection was found
+        if int_exists:
+            split_brep2, int_exists = intersect_solid(
+                int_solids[j], split_brep1, False)
+            int_solids[j] = split_brep2
 
     return int_solids
 
 
-def intersect_solid(solid, other_solid):
+def intersect_solid(solid, other_solid, bb_check=True):
     """Intersect the co-planar faces of one solid Brep using another.
 
     Args:
         solid: The solid Brep which will be split with intersections.
         other_solid: The other Brep, which will be used to split.
-        tolerance: Distance within which two points are considered to be co-located.
+        bb_check: Boolean to note whether the bounding boxes of the two Breps
+            should be checked for overlap before any intersection is attempted.
+            This can be set to False when the overlap of the bounding boxes has
+            already been checked in order to avoid doing it twice. (Default: True).
 
     Returns:
         A tuple with two elements
@@ -278,6 +290,11 @@ def intersect_solid(solid, other_solid):
             between the solid and the other_solid. If False, there's no need to
             split the other_solid with the input solid.
     """
+    # check that the bounding boxes overlap before doing any expensive intersection
+    if bb_check and not overlapping_bounding_boxes(
+            solid.GetBoundingBox(False), other_solid.GetBoundingBox(False)):
+        return solid, False
+
     # variables to track the splitting process
     intersection_exists = False  # boolean to note whether an intersection exists
     done = False  # value to note when there are no more intersections
@@ -334,46 +351,34 @@ def overlapping_bounding_boxes(bound_box1, bound_box2):
         bound_box1: The first bound_box to check.
         bound_box2: The second bound_box to check.
     """
-    # Bounding box check using the Separating Axis Theorem
-    bb1_width = bound_box1.Max.X - bound_box1.Min.X
-    bb2_width = bound_box2.Max.X - bound_box2.Min.X
-    dist_btwn_x = abs(bound_box1.Center.X - bound_box2.Center.X)
-    x_gap_btwn_box = dist_btwn_x - (0.5 * bb1_width) - (0.5 * bb2_width)
-
-    bb1_depth = bound_box1.Max.Y - bound_box1.Min.Y
-    bb2_depth = bound_box2.Max.Y - bound_box2.Min.Y
-    dist_btwn_y = abs(bound_box1.Center.Y - bound_box2.Center.Y)
-    y_gap_btwn_box = dist_btwn_y - (0.5 * bb1_depth) - (0.5 * bb2_depth)
-
-    bb1_height = bound_box1.Max.Z - bound_box1.Min.Z
-    bb2_height = bound_box2.Max.Z - bound_box2.Min.Z
-    dist_btwn_z = abs(bound_box1.Center.Z - bound_box2.Center.Z)
-    z_gap_btwn_box = dist_btwn_z - (0.5 * bb1_height) - (0.5 * bb2_height)
-
-    if x_gap_btwn_box > tolerance or y_gap_btwn_box > tolerance or \
-            z_gap_btwn_box > tolerance:
-        return False  # no overlap
-    return True  # overlap exists
+    # use the same min/max test as the pairwise checks of intersect_solids
+    extents1, extents2 = _bound_box_extents((bound_box1, bound_box2))
+    return _overlapping_extents(extents1, extents2)
 
 
-def split_solid_to_floors(building_solid, floor_heights):
+def split_solid_to_floors(building_solid, floor_heights, parallel=False):
     """Extract a series of planar floor surfaces from solid building massing.
 
     Args:
         building_solid: A closed brep representing a building massing.
         floor_heights: An array of float values for the floor heights, which
             will be used to generate planes that subdivide the building solid.
+        parallel: Boolean to indicate if the floors should be generated in
+            parallel with one floor height per CPU. (Default: False).
 
     Returns:
         floor_breps -- A list of planar, horizontal breps representing the floors
         of the building.
     """
-    # get the floor brep at each of the floor heights.
-    floor_breps = []
-    for hgt in floor_heights:
+    floor_heights = list(floor_heights)  # allow any iterable of heights
+    floor_breps = [None] * len(floor_heights)  # list to be filled with results
+    z_axis = rg.Vector3d.ZAxis  # constant used for all section planes
+
+    def split_floor(i):
+        """Get the floor brep at one of the floor heights."""
         story_breps = []
-        floor_base_pt = rg.Point3d(0, 0, hgt)
-        section_plane = rg.Plane(floor_base_pt, rg.Vector3d.ZAxis)
+        floor_base_pt = rg.Point3d(0, 0, floor_heights[i])
+        section_plane = rg.Plane(floor_base_pt, z_axis)
         floor_crvs = rg.Brep.CreateContourCurves(building_solid, section_plane)
         try:  # Assume a single countour curve has been found
             floor_brep = rg.Brep.CreatePlanarBreps(floor_crvs, tolerance)
@@ -381,8 +386,13 @@ def split_solid_to_floors(building_solid, floor_heights):
             floor_brep = rg.Brep.CreatePlanarBreps(floor_crvs)
         if floor_brep is not None:
             story_breps.extend(floor_brep)
-        floor_breps.append(story_breps)
+        floor_breps[i] = story_breps
 
+    if parallel:
+        tasks.Parallel.ForEach(range(len(floor_heights)), split_floor)
+    else:
+        for i in range(len(floor_heights)):
+            split_floor(i)
     return floor_breps
 
 
@@ -393,3 +403,82 @@ def geo_min_max_height(geometry):
     """
     bound_box = geometry.GetBoundingBox(rg.Plane.WorldXY)
     return bound_box.Min.Z, bound_box.Max.Z
+
+
+def geo_min_max_heights(geometries):
+    """Get the min and max Z values of each object in an array of objects.
+
+    This is equivalent to calling geo_min_max_height for each object but it is
+    faster when there are many objects since the world XY plane is only fetched
+    from Rhino once.
+
+    Args:
+        geometries: An array of Rhino geometry objects.
+
+    Returns:
+        A list of (min Z, max Z) tuples with one tuple for each input object.
+    """
+    world_xy = rg.Plane.WorldXY
+    min_max = []
+    for geo in geometries:
+        bound_box = geo.GetBoundingBox(world_xy)
+        min_max.append((bound_box.Min.Z, bound_box.Max.Z))
+    return min_max
+
+
+def _bound_box_extents(bound_boxes):
+    """Get a list of (min x, min y, min z, max x, max y, max z) for bounding boxes.
+
+    Each of the .NET properties of the bounding boxes is accessed only once such
+    that the many pairwise overlap checks can be run on plain Python numbers.
+    """
+    extents = []
+    for bb in bound_boxes:
+        b_min, b_max = bb.Min, bb.Max
+        extents.append((b_min.X, b_min.Y, b_min.Z, b_max.X, b_max.Y, b_max.Z))
+    return extents
+
+
+def _overlapping_pairs(extents):
+    """Get a list of (i, j) index pairs with i < j for overlapping bounding box extents.
+
+    This uses a sweep-and-prune along the X axis such that only the boxes with
+    overlapping X intervals are compared with one another, which avoids checking
+    every possible pair when the boxes are spread out across a scene.
+
+    Args:
+        extents: A list of bounding box extents derived from _bound_box_extents.
+
+    Returns:
+        A list of (i, j) tuples sorted in the same order that they would be
+        encountered by looping over every pair of the input extents.
+    """
+    pairs = []
+    active = []  # heap of (max x, index) for boxes that may still overlap
+    for i in sorted(range(len(extents)), key=lambda x: extents[x][0]):
+        ext_1 = extents[i]
+        sweep_x = ext_1[0] - tolerance
+        while active and active[0][0] < sweep_x:  # evict boxes left behind
+            heapq.heappop(active)
+        for _, j in active:
+            if _overlapping_extents(ext_1, extents[j]):
+                pairs.append((i, j) if i < j else (j, i))
+        heapq.heappush(active, (ext_1[3], i))
+    pairs.sort()
+    return pairs
+
+
+def _overlapping_extents(extents1, extents2):
+    """Check if two bounding box extents overlap within the tolerance.
+
+    Args:
+        extents1: The first bounding box extents derived from _bound_box_extents.
+        extents2: The second bounding box extents derived from _bound_box_extents.
+    """
+    min_x1, min_y1, min_z1, max_x1, max_y1, max_z1 = extents1
+    min_x2, min_y2, min_z2, max_x2, max_y2, max_z2 = extents2
+    if min_x1 - max_x2 > tolerance or min_x2 - max_x1 > tolerance or \
+            min_y1 - max_y2 > tolerance or min_y2 - max_y1 > tolerance or \
+            min_z1 - max_z2 > tolerance or min_z2 - max_z1 > tolerance:
+        return False  # no overlap
+    return True  # overlap exists
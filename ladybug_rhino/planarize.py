@@ -7,16 +7,18 @@ try:
 except ImportError as e:
     raise ImportError("Failed to import ladybug_geometry.\n{}".format(e))
 
+try:
+    import System.Threading.Tasks as tasks
+except ImportError as e:
+    print('Failed to import Windows/.NET libraries\nParallel processing functionality '
+          'will not be available\n{}'.format(e))
+
 try:
     import Rhino.Geometry as rg
 except ImportError as e:
     raise ImportError(
         "Failed to import Rhino.\n{}".format(e))
 
-import sys
-if (sys.version_info > (3, 0)):  # python 3
-    xrange = range
-
 
 """____________INDIVIDUAL SURFACES TO PLANAR____________"""
 
@@ -44,7 +46,7 @@ def planar_face_curved_edge_vertices(b_face, count, meshing_parameters):
     loop_verts = []
     try:
         loop_pcrvs = [loop_pcrv.SegmentCurve(i)
-                      for i in xrange(loop_pcrv.SegmentCount)]
+                      for i in range(loop_pcrv.SegmentCount)]
     except Exception:
         try:
             loop_pcrvs = [loop_pcrv[0]]
@@ -58,23 +60,29 @@ def planar_face_curved_edge_vertices(b_face, count, meshing_parameters):
             seg_mesh = rg.Mesh.CreateFromSurface(
                 rg.Surface.CreateExtrusion(seg, f_norm),
                 meshing_parameters)
-            for i in xrange(seg_mesh.Vertices.Count / 2 - 1):
-                loop_verts.append(_point3d(seg_mesh.Vertices[i]))
+            seg_pts = seg_mesh.Vertices.ToPoint3dArray()  # copy vertices at once
+            loop_verts.extend([_point3d(seg_pts[i])
+                               for i in range(len(seg_pts) // 2 - 1)])
     return loop_verts
 
 
-def curved_surface_faces(b_face, meshing_parameters):
+def curved_surface_faces(b_face, meshing_parameters, mesh=None):
     """Extract Face3D objects from a curved brep face.
 
     Args:
         b_face: A curved brep face.
         meshing_parameters: Rhino Meshing Parameters to describe how
             curved edge should be converted into planar elements.
+        mesh: An optional Rhino Mesh that has already been generated from the
+            b_face. When supplied, this mesh will be used to create the Face3D
+            objects and the b_face will not be meshed again. (Default: None).
 
     Returns:
         A list of ladybug Face3D objects that together approximate the input
         curved surface.
     """
+    if mesh is not None:  # the face has already been meshed
+        return mesh_faces_to_face3d(mesh)
     if b_face.OrientationIsReversed:
         b_face.Reverse(0, True)
     face_brep = b_face.DuplicateFace(True)
@@ -85,7 +93,7 @@ def curved_surface_faces(b_face, meshing_parameters):
 """____________SOLID BREPS TO PLANAR____________"""
 
 
-def curved_solid_faces(brep, meshing_parameters):
+def curved_solid_faces(brep, meshing_parameters, parallel=False, planar_faces=None):
     """Extract Face3D objects from a curved solid brep.
 
     This methods ensures that the resulting Face3Ds form a closed solid by
@@ -96,6 +104,13 @@ def curved_solid_faces(brep, meshing_parameters):
         meshing_parameters: Rhino Meshing Parameters to describe how curved surfaces
             should be converted into planar elements. If None, Rhino's Default
             Meshing Parameters will be used.
+        parallel: Boolean to indicate if the faces of the brep should be converted
+            in parallel with one brep face per CPU. (Default: False).
+        planar_faces: An optional list of booleans for whether each face of the
+            brep is planar, which can be obtained from the face_planarity function.
+            This can be used to avoid evaluating the planarity of the faces again
+            when it has already been done. If None, it will be evaluated for each
+            face. (Default: None).
 
     Returns:
         A list of ladybug Face3D objects that together approximate the input brep.
@@ -103,25 +118,35 @@ def curved_solid_faces(brep, meshing_parameters):
     # mesh the geometry as a solid
     mesh_par = meshing_parameters or rg.MeshingParameters.Default  # default
     meshed_geo = rg.Mesh.CreateFromBrep(brep, mesh_par)
-
-    # evaluate each mesh face to see what larger brep face it is a part of
-    faces = []
-    for mesh, b_face in zip(meshed_geo, brep.Faces):
-        if b_face.IsPlanar(tolerance):  # only take the naked vertices of planar faces
+    if planar_faces is None:
+        planar_faces = face_planarity(brep)
+    face_groups = [None] * len(meshed_geo)  # list to be filled with results
+
+    def convert_face(i):
+        """Evaluate the mesh of a brep face to get the Face3Ds that represent it."""
+        mesh = meshed_geo[i]
+        if planar_faces[i]:  # only take the naked vertices of planar faces
             naked_edges = mesh.GetNakedEdges()
             all_verts = []
             for loop_pline in naked_edges:  # each loop_pline is a boundary/hole
-                all_verts.append([_point3d(loop_pline.Item[i])
-                                  for i in xrange(loop_pline.Count - 1)])
+                pline_pts = loop_pline.ToArray()  # copy the points out of Rhino at once
+                all_verts.append([_point3d(pline_pts[j])
+                                  for j in range(len(pline_pts) - 1)])
             if len(all_verts) == 1:  # No holes in the shape
-                faces.append(Face3D(all_verts[0]))
+                face = Face3D(all_verts[0])
             else:  # There's at least one hole in the shape
-                faces.append(
-                    Face3D(boundary=all_verts[0], holes=all_verts[1:]))
-        else:
-            faces.extend(mesh_faces_to_face3d(mesh))
-    # remove colinear vertices as the meshing process makes a lot of them
-    return [face.remove_colinear_vertices(tolerance) for face in faces]
+                face = Face3D(boundary=all_verts[0], holes=all_verts[1:])
+            # remove colinear vertices as the meshing process makes a lot of them
+            face_groups[i] = [face.remove_colinear_vertices(tolerance)]
+        else:  # colinear vertices are removed and degenerate faces are skipped
+            face_groups[i] = mesh_faces_to_face3d(mesh)
+
+    if parallel:
+        tasks.Parallel.ForEach(range(len(meshed_geo)), convert_face)
+    else:
+        for i in range(len(meshed_geo)):
+            convert_face(i)
+    return [face for faces in face_groups for face in faces]
 
 
 """________________EXTRA HELPER FUNCTIONS________________"""
@@ -133,15 +158,34 @@ def has_curved_face(brep):
     Args:
         brep: A Rhino Brep to test whether it has a curved face.
     """
-    for b_face in brep.Faces:
-        if not b_face.IsPlanar(tolerance):
+    # check the underlying surfaces directly since several faces can share one
+    for b_srf in brep.Surfaces:
+        if not b_srf.IsPlanar(tolerance):
             return True
     return False
 
 
+def face_planarity(brep):
+    """Get a list of booleans for whether each face of a Rhino Brep is planar.
+
+    This is useful when the planarity of the faces is needed in more than one
+    place since the evaluation of it can be expensive for NURBS surfaces.
+
+    Args:
+        brep: A Rhino Brep for which the planarity of each face will be evaluated.
+    """
+    return [b_face.IsPlanar(tolerance) for b_face in brep.Faces]
+
+
 def mesh_faces_to_face3d(mesh):
     """Convert a curved Rhino mesh faces into planar ladybug_geometry Face3D.
 
+    Duplicate and colinear vertices are removed from each face using the
+    remove_colinear_vertices method of Face3D and the Rhino model tolerance.
+    So quads that the mesher collapsed at a singularity of the surface (eg. the
+    pole of a sphere) become triangles. Faces that are left with fewer than
+    three vertices (eg. zero-area triangles) are not included in the result.
+
     Args:
         mesh: A curved Rhino mesh.
 
@@ -149,29 +193,73 @@ def mesh_faces_to_face3d(mesh):
         A list of ladybug Face3D objects derived from the input mesh faces.
     """
     faces = []
-    for m_face in mesh.Faces:
+    for verts in mesh_faces_to_vertices(mesh):
+        try:
+            faces.append(Face3D(verts).remove_colinear_vertices(tolerance))
+        except AssertionError:  # degenerate face with fewer than 3 vertices
+            pass
+    return faces
+
+
+def mesh_faces_to_vertices(mesh):
+    """Convert a curved Rhino mesh faces into tuples of planar ladybug Point3D.
+
+    Non-planar quads are split into two triangles but, unlike mesh_faces_to_face3d,
+    no vertices are removed from the faces and no degenerate faces are skipped.
+    So there is one tuple for each mesh face plus one for each split quad.
+
+    Args:
+        mesh: A curved Rhino mesh.
+
+    Returns:
+        A list of tuples with three or four ladybug Point3D objects. Each tuple
+        represents a planar face derived from the input mesh faces.
+    """
+    m_faces = mesh.Faces  # fetch the face list from Rhino only once
+    faces = [None] * m_faces.Count  # one tuple of vertices for each mesh face
+    split_faces = []  # second triangles of any non-planar quads that were split
+    # copy all vertices out of Rhino at once and convert each of them only once
+    pts = tuple(Point3D(pt.X, pt.Y, pt.Z) for pt in mesh.Vertices.ToPoint3dArray())
+    for f_count, m_face in enumerate(m_faces):
+        pt_a, pt_b, pt_c = pts[m_face.A], pts[m_face.B], pts[m_face.C]
         if m_face.IsQuad:
-            lb_face = Face3D(
-                tuple(_point3d(mesh.Vertices[i]) for i in
-                      (m_face.A, m_face.B, m_face.C, m_face.D)))
-            if lb_face.check_planar(tolerance, False):
-                faces.append(lb_face)
-            else:
-                lb_face_1 = Face3D(
-                    tuple(_point3d(mesh.Vertices[i]) for i in
-                          (m_face.A, m_face.B, m_face.C)))
-                lb_face_2 = Face3D(
-                    tuple(_point3d(mesh.Vertices[i]) for i in
-                          (m_face.C, m_face.D, m_face.A)))
-                faces.extend([lb_face_1, lb_face_2])
-        else:
-            lb_face = Face3D(
-                tuple(_point3d(mesh.Vertices[i]) for i in
-                      (m_face.A, m_face.B, m_face.C)))
-            faces.append(lb_face)
+            pt_d = pts[m_face.D]
+            if _quad_is_planar(pt_a, pt_b, pt_c, pt_d):
+                faces[f_count] = (pt_a, pt_b, pt_c, pt_d)
+                continue
+            # split the quad into two triangles
+            split_faces.append((pt_c, pt_d, pt_a))
+        faces[f_count] = (pt_a, pt_b, pt_c)
+    if split_faces:
+        faces.extend(split_faces)
     return faces
 
 
+def _quad_is_planar(pt_a, pt_b, pt_c, pt_d):
+    """Check whether four ladybug Point3Ds of a quad lie in a plane within tolerance.
+
+    This gives the same result as building a Face3D from the points and using
+    its check_planar method but it works directly with the coordinates of the
+    points such that no throwaway Face3D is created for non-planar quads.
+    """
+    ab_x, ab_y, ab_z = pt_b.x - pt_a.x, pt_b.y - pt_a.y, pt_b.z - pt_a.z
+    ac_x, ac_y, ac_z = pt_c.x - pt_a.x, pt_c.y - pt_a.y, pt_c.z - pt_a.z
+    ad_x, ad_y, ad_z = pt_d.x - pt_a.x, pt_d.y - pt_a.y, pt_d.z - pt_a.z
+    # sum the cross products of the two triangles fanning from the first point
+    n_x = (ab_y * ac_z - ab_z * ac_y) + (ac_y * ad_z - ac_z * ad_y)
+    n_y = (ab_z * ac_x - ab_x * ac_z) + (ac_z * ad_x - ac_x * ad_z)
+    n_z = (ab_x * ac_y - ab_y * ac_x) + (ac_x * ad_y - ac_y * ad_x)
+    n_mag = (n_x ** 2 + n_y ** 2 + n_z ** 2) ** 0.5
+    if n_mag == 0:  # zero area quad; default to the positive Z axis like Face3D
+        n_x, n_y, n_z, n_mag = 0, 0, 1, 1
+    # check the distance of each point to the plane through the first point
+    max_dist = tolerance * n_mag
+    for v_x, v_y, v_z in ((ab_x, ab_y, ab_z), (ac_x, ac_y, ac_z), (ad_x, ad_y, ad_z)):
+        if abs(v_x * n_x + v_y * n_y + v_z * n_z) >= max_dist:
+            return False
+    return True
+
+
 def _point3d(point):
     """Ladybug Point3D from Rhino Point3d."""
     return Point3D(point.X, point.Y, point.Z)
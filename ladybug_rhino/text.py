@@ -123,8 +123,7 @@ class TextGoo(gh.Kernel.Types.GH_GeometricGoo[rh.Display.Text3d],
     def DrawViewportWires(self, args):
         if self.m_value is None:
             return
-        color = black() if black is not None else args.Color
-        args.Pipeline.Draw3dText(self.m_value, color)
+        args.Pipeline.Draw3dText(self.m_value, black())
 
     def DrawViewportMeshes(self, args):
         # Do not draw in meshing layer.
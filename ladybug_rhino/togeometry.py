@@ -76,7 +76,7 @@ def to_polygon2d(polygon):
 
 def to_mesh2d(mesh, color_by_face=True):
     """Ladybug Mesh2D from Rhino Mesh."""
-    lb_verts = tuple(to_point2d(pt) for pt in mesh.Vertices)
+    lb_verts = tuple(to_point2d(pt) for pt in mesh.Vertices.ToPoint3dArray())
     lb_faces, colors = _extract_mesh_faces_colors(mesh, color_by_face)
     return Mesh2D(lb_verts, lb_faces, colors)
 
@@ -132,7 +132,7 @@ def to_face3d(geo, meshing_parameters=None):
     """
     faces = []  # list of Face3Ds to be populated and returned
     if isinstance(geo, rg.Mesh):  # convert each Mesh face to a Face3D
-        pts = tuple(to_point3d(pt) for pt in geo.Vertices)
+        pts = tuple(to_point3d(pt) for pt in geo.Vertices.ToPoint3dArray())
         for face in geo.Faces:
             if face.IsQuad:
                 all_verts = (pts[face[0]], pts[face[1]], pts[face[2]], pts[face[3]])
@@ -140,7 +140,7 @@ def to_face3d(geo, meshing_parameters=None):
                 all_verts = (pts[face[0]], pts[face[1]], pts[face[2]])
             lb_face = Face3D(all_verts)
             if lb_face.area != 0:
-                faces.append(Face3D(all_verts))
+                faces.append(lb_face)
     else:  # convert each Brep Face to a Face3D
         meshing_parameters = meshing_parameters or rg.MeshingParameters.Default  # default
         for b_face in geo.Faces:
@@ -176,14 +176,18 @@ def to_polyface3d(geo, meshing_parameters=None):
             Rhino's Default Meshing Parameters will be used.
     """
     mesh_par = meshing_parameters or rg.MeshingParameters.Default  # default
-    if not isinstance(geo, rg.Mesh) and _planar.has_curved_face(geo):  # keep solidity
-        return Polyface3D.from_faces(_planar.curved_solid_faces(geo, mesh_par), tolerance)
+    if not isinstance(geo, rg.Mesh):
+        planar_faces = _planar.face_planarity(geo)  # evaluate planarity only once
+        if not all(planar_faces):  # there is a curved face; keep solidity
+            faces = _planar.curved_solid_faces(
+                geo, mesh_par, planar_faces=planar_faces)
+            return Polyface3D.from_faces(faces, tolerance)
     return Polyface3D.from_faces(to_face3d(geo, mesh_par), tolerance)
 
 
 def to_mesh3d(mesh, color_by_face=True):
     """Ladybug Mesh3D from Rhino Mesh."""
-    lb_verts = tuple(to_point3d(pt) for pt in mesh.Vertices)
+    lb_verts = tuple(to_point3d(pt) for pt in mesh.Vertices.ToPoint3dArray())
     lb_faces, colors = _extract_mesh_faces_colors(mesh, color_by_face)
     return Mesh3D(lb_verts, lb_faces, colors)
 
@@ -0,0 +1,41 @@
+import rhinoinside
+rhinoinside.load()
+import Rhino
+from ladybug_rhino.planarize import mesh_faces_to_face3d
+
+
+def _rhino_mesh(vertices, faces):
+    """Build a Rhino Mesh from lists of vertex coordinates and face indices."""
+    mesh = Rhino.Geometry.Mesh()
+    for vert in vertices:
+        mesh.Vertices.Add(*vert)
+    for face in faces:
+        mesh.Faces.AddFace(*face)
+    return mesh
+
+
+def test_mesh_faces_to_face3d_collapsed_quad():
+    """Test that a quad collapsed at a pole becomes a triangle."""
+    mesh = _rhino_mesh(
+        [(1, 0, 0), (0, 1, 0), (0, 0, 1), (0, 0, 1)], [(0, 1, 2, 3)])
+    faces = mesh_faces_to_face3d(mesh)
+    assert len(faces) == 1
+    assert len(faces[0].vertices) == 3
+
+
+def test_mesh_faces_to_face3d_non_planar_quad():
+    """Test that a non-planar quad is split into two triangles."""
+    mesh = _rhino_mesh(
+        [(0, 0, 0), (1, 0, 0), (1, 1, 1), (0, 1, 0)], [(0, 1, 2, 3)])
+    faces = mesh_faces_to_face3d(mesh)
+    assert len(faces) == 2
+    assert all(len(face.vertices) == 3 for face in faces)
+
+
+def test_mesh_faces_to_face3d_zero_area_triangle():
+    """Test that a zero-area triangle is not included in the result."""
+    mesh = _rhino_mesh(
+        [(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0)], [(0, 1, 2), (0, 1, 3)])
+    faces = mesh_faces_to_face3d(mesh)
+    assert len(faces) == 1
+    assert faces[0].area == 0.5